@@ -10,10 +10,97 @@ bl_info = {
 
 import bpy
 from bpy.utils import register_class, unregister_class
+from bpy.app.handlers import persistent
+from bpy_extras.io_utils import ImportHelper, ExportHelper
 import math
 import random
-from mathutils import Vector, Matrix
+from mathutils import Vector, Matrix, kdtree
 import functools
+import bmesh
+import csv
+import os
+import sys
+import time
+import numpy as np
+
+class ITEMPRO_SymmetryLink(bpy.types.PropertyGroup):
+    source: bpy.props.PointerProperty(
+        name="Source",
+        type=bpy.types.Object
+    )
+    mirror: bpy.props.PointerProperty(
+        name="Mirror",
+        type=bpy.types.Object
+    )
+    axis: bpy.props.EnumProperty(
+        name="Mirror Axis",
+        items=[
+            ('X', 'X', 'Mirror on X axis'),
+            ('Y', 'Y', 'Mirror on Y axis'),
+            ('Z', 'Z', 'Mirror on Z axis'),
+        ],
+        default='X'
+    )
+
+class ITEMPRO_ObjectProperties(bpy.types.PropertyGroup):
+    live_constraints: bpy.props.BoolProperty(
+        name="Live Constraints",
+        description="Apply dimension locks and proportional constraints while editing",
+        default=False
+    )
+    # Cached so live updates never have to evaluate the bounding box
+    unit_dimensions: bpy.props.FloatVectorProperty(
+        name="Unit Dimensions",
+        description="Object dimensions at a scale of 1.0",
+        size=3
+    )
+    base_dimensions: bpy.props.FloatVectorProperty(
+        name="Base Dimensions",
+        description="Dimensions kept for locked axes",
+        size=3
+    )
+    last_scale: bpy.props.FloatVectorProperty(
+        name="Last Scale",
+        description="Scale seen by the last live constraint update",
+        size=3,
+        default=(1.0, 1.0, 1.0)
+    )
+
+    # Viewport budget
+    budget_managed: bpy.props.BoolProperty(
+        name="Budget Managed",
+        description="Object was generated by DP Item Pro and follows the viewport budget",
+        default=False
+    )
+    budget_reduced: bpy.props.BoolProperty(
+        name="Budget Reduced",
+        default=False
+    )
+    source_mesh: bpy.props.PointerProperty(
+        name="Source Mesh",
+        description="Mesh this object was generated from, proxies are shared per source",
+        type=bpy.types.Mesh
+    )
+    full_mesh: bpy.props.PointerProperty(
+        name="Full Mesh",
+        description="Full resolution mesh while a proxy is displayed",
+        type=bpy.types.Mesh
+    )
+    full_display_type: bpy.props.StringProperty(
+        name="Full Display Type",
+        default='TEXTURED'
+    )
+
+def _update_lock_dimensions(self, context):
+    # Locked axes hold the dimensions they had when the lock was toggled
+    for obj in context.scene.objects:
+        item = obj.item_pro
+        if item.live_constraints:
+            _capture_constraint_base(obj, item.unit_dimensions[:])
+
+def _update_budget(self, context):
+    _budget_state["origin"] = None
+    _evaluate_budget(context.scene)
 
 class ITEMPRO_Properties(bpy.types.PropertyGroup):
     uniform_scale: bpy.props.FloatProperty(
@@ -54,6 +141,14 @@ class ITEMPRO_Properties(bpy.types.PropertyGroup):
         ],
         default='X'
     )
+    live_symmetry: bpy.props.BoolProperty(
+        name="Live Link",
+        description="Keep symmetry copies in sync when their source is transformed",
+        default=False
+    )
+    symmetry_links: bpy.props.CollectionProperty(
+        type=ITEMPRO_SymmetryLink
+    )
     distribution_type: bpy.props.EnumProperty(
         name="Distribution",
         items=[
@@ -105,6 +200,38 @@ class ITEMPRO_Properties(bpy.types.PropertyGroup):
         max=360.0
     )
 
+    # Animation settings
+    anim_type: bpy.props.EnumProperty(
+        name="Animation",
+        items=[
+            ('TURNTABLE', 'Turntable', 'Full rotation around Z over the frame range'),
+            ('BUILD_UP', 'Build Up', 'Rise into place from below'),
+        ],
+        default='TURNTABLE'
+    )
+    anim_frame_start: bpy.props.IntProperty(
+        name="Start Frame",
+        description="First frame of the baked animation",
+        default=1
+    )
+    anim_frame_count: bpy.props.IntProperty(
+        name="Frames",
+        description="Number of frames to bake per object",
+        default=100,
+        min=2
+    )
+    anim_time_offset: bpy.props.FloatProperty(
+        name="Stagger",
+        description="Frames between the start of consecutive objects, ordered along the align axis",
+        default=0.0
+    )
+    anim_build_height: bpy.props.FloatProperty(
+        name="Build Height",
+        description="Distance objects rise from in a build up",
+        default=2.0,
+        unit='LENGTH'
+    )
+
     # Dimensions
     dimensions: bpy.props.FloatVectorProperty(
         name="Dimensions",
@@ -126,7 +253,8 @@ class ITEMPRO_Properties(bpy.types.PropertyGroup):
         name="Lock Dimensions",
         description="Lock individual dimensions",
         size=3,
-        default=(False, False, False)
+        default=(False, False, False),
+        update=_update_lock_dimensions
     )
 
     # Precision settings
@@ -138,6 +266,101 @@ class ITEMPRO_Properties(bpy.types.PropertyGroup):
         max=1.0
     )
 
+    # Viewport budget settings
+    budget_enabled: bpy.props.BoolProperty(
+        name="Viewport Budget",
+        description="Reduce the display of generated objects beyond the budget",
+        default=False,
+        update=_update_budget
+    )
+
+    budget_max_count: bpy.props.IntProperty(
+        name="Max Full Detail",
+        description="Number of generated objects closest to the reference shown at full detail",
+        default=500,
+        min=0,
+        update=_update_budget
+    )
+
+    budget_distance: bpy.props.FloatProperty(
+        name="Max Distance",
+        description="Generated objects further than this from the reference are reduced (0 for no limit)",
+        default=50.0,
+        min=0.0,
+        unit='LENGTH',
+        update=_update_budget
+    )
+
+    budget_reference: bpy.props.PointerProperty(
+        name="Reference",
+        description="Object distances are measured from, the scene camera when empty",
+        type=bpy.types.Object,
+        update=_update_budget
+    )
+
+    budget_mode: bpy.props.EnumProperty(
+        name="Reduced Display",
+        items=[
+            ('BOUNDS', 'Bounds', 'Display as bounding box'),
+            ('PROXY', 'Proxy', 'Display a shared low poly proxy mesh'),
+        ],
+        default='BOUNDS',
+        update=_update_budget
+    )
+
+    budget_threshold: bpy.props.FloatProperty(
+        name="Update Threshold",
+        description="Distance the reference has to move before the budget is evaluated again",
+        default=1.0,
+        min=0.0,
+        unit='LENGTH'
+    )
+
+    audit_max_coordinate: bpy.props.FloatProperty(
+        name="Max Coordinate",
+        description="Locations further than this from the world origin are reported",
+        default=100000.0,
+        min=0.0,
+        unit='LENGTH'
+    )
+
+    # Ground settings
+    ground_mode: bpy.props.EnumProperty(
+        name="Ground",
+        items=[
+            ('PLANE', 'Plane', 'Place objects on the Z=0 plane'),
+            ('TERRAIN', 'Terrain', 'Place objects on a terrain mesh'),
+        ],
+        default='PLANE'
+    )
+
+    terrain_object: bpy.props.PointerProperty(
+        name="Terrain",
+        description="Mesh sampled into a height grid for ground placement",
+        type=bpy.types.Object,
+        poll=lambda self, obj: obj.type == 'MESH'
+    )
+
+    terrain_resolution: bpy.props.IntProperty(
+        name="Terrain Resolution",
+        description="Height grid samples along the longer side of the terrain",
+        default=256,
+        min=8,
+        max=4096
+    )
+
+    minimize_movement: bpy.props.BoolProperty(
+        name="Minimize Movement",
+        description="Assign objects to the distribution slots closest to where they are",
+        default=False
+    )
+
+    respect_parenting: bpy.props.BoolProperty(
+        name="Respect Parenting",
+        description="Place parented objects in world space, compensating for their parents",
+        default=False
+    )
+
     # Pivot point settings
     pivot_point: bpy.props.EnumProperty(
         name="Pivot Point",
@@ -171,6 +394,21 @@ class ITEMPRO_Properties(bpy.types.PropertyGroup):
         default=True
     )
 
+    # Proximity settings
+    proximity_radius: bpy.props.FloatProperty(
+        name="Search Radius",
+        description="Radius for proximity selection",
+        default=2.0,
+        min=0.0,
+        unit='LENGTH'
+    )
+
+    proximity_use_bounds: bpy.props.BoolProperty(
+        name="Use Bounds Centers",
+        description="Measure from bounding box centers instead of object origins",
+        default=False
+    )
+
 class ITEMPRO_PT_MainPanel(bpy.types.Panel):
     bl_label = "DP Item Pro"
     bl_idname = "ITEMPRO_PT_MainPanel"
@@ -207,10 +445,20 @@ class ITEMPRO_PT_MainPanel(bpy.types.Panel):
             # Constrain Proportional
             row = box.row()
             row.prop(props, "constrain_proportional")
-            
+
+            # Live Constraints
+            row = box.row(align=True)
+            row.label(text="Live: On" if obj.item_pro.live_constraints else "Live: Off")
+            op = row.operator("itempro.set_live_constraints", text="Enable")
+            op.enable = True
+            op = row.operator("itempro.set_live_constraints", text="Disable")
+            op.enable = False
+
             # Transform Precision
             row = box.row()
             row.prop(props, "transform_precision")
+            row = box.row()
+            row.prop(props, "respect_parenting")
             
             # Apply Dimensions Button
             row = box.row()
@@ -227,10 +475,15 @@ class ITEMPRO_PT_MainPanel(bpy.types.Panel):
             row = box.row(align=True)
             row.operator("itempro.apply_uniform_scale")
             row.operator("itempro.reset_scale")
+            box.operator("itempro.apply_transforms")
 
             # Ground and Pivot Tools
             box = layout.box()
             box.label(text="Ground and Pivot Tools:")
+            box.prop(props, "ground_mode")
+            if props.ground_mode == 'TERRAIN':
+                box.prop(props, "terrain_object")
+                box.prop(props, "terrain_resolution")
             box.operator("itempro.place_on_ground", text="Place on Ground")
             
             sub_box = box.box()
@@ -259,7 +512,9 @@ class ITEMPRO_PT_MainPanel(bpy.types.Panel):
                 box.prop(props, "random_range")
             
             box.prop(props, "spacing")
+            box.prop(props, "minimize_movement")
             box.operator("itempro.distribute_objects")
+            box.operator("itempro.import_placements")
 
             # Rotation Tools
             box = layout.box()
@@ -269,6 +524,18 @@ class ITEMPRO_PT_MainPanel(bpy.types.Panel):
             row.operator("itempro.smooth_rotate")
             row.operator("itempro.random_rotate")
 
+            # Animation Tools
+            box = layout.box()
+            box.label(text="Animation Tools:")
+            box.prop(props, "anim_type")
+            row = box.row(align=True)
+            row.prop(props, "anim_frame_start")
+            row.prop(props, "anim_frame_count")
+            box.prop(props, "anim_time_offset")
+            if props.anim_type == 'BUILD_UP':
+                box.prop(props, "anim_build_height")
+            box.operator("itempro.bake_animation")
+
             # Array Tools
             box = layout.box()
             box.label(text="Array Tools:")
@@ -276,6 +543,21 @@ class ITEMPRO_PT_MainPanel(bpy.types.Panel):
             box.prop(props, "duplication_offset")
             box.operator("itempro.create_array")
 
+            # Viewport Budget
+            box = layout.box()
+            box.label(text="Viewport Budget:")
+            box.prop(props, "budget_enabled")
+            col = box.column(align=True)
+            col.active = props.budget_enabled
+            col.prop(props, "budget_max_count")
+            col.prop(props, "budget_distance")
+            col.prop(props, "budget_reference")
+            col.prop(props, "budget_mode")
+            col.prop(props, "budget_threshold")
+            row = box.row(align=True)
+            row.operator("itempro.update_budget")
+            row.operator("itempro.restore_full_detail")
+
             # Symmetry Tools
             box = layout.box()
             box.label(text="Symmetry Tools:")
@@ -283,6 +565,11 @@ class ITEMPRO_PT_MainPanel(bpy.types.Panel):
             row = box.row(align=True)
             row.operator("itempro.mirror_object")
             row.operator("itempro.create_symmetry")
+            row = box.row(align=True)
+            row.prop(props, "live_symmetry")
+            row.operator("itempro.unlink_symmetry")
+            if props.symmetry_links:
+                box.label(text=f"Live Links: {len(props.symmetry_links)}")
 
             # Add new tools section
             box = layout.box()
@@ -299,6 +586,43 @@ class ITEMPRO_PT_MainPanel(bpy.types.Panel):
             row = box.row()
             row.operator("itempro.align_objects")
 
+            # Cleanup Tools
+            box = layout.box()
+            box.label(text="Cleanup Tools:")
+            row = box.row(align=True)
+            op = row.operator("itempro.find_duplicates", text="Select Duplicates")
+            op.action = 'SELECT'
+            op = row.operator("itempro.find_duplicates", text="Delete Duplicates")
+            op.action = 'DELETE'
+
+            # Transform Audit
+            box = layout.box()
+            box.label(text="Transform Audit:")
+            box.prop(props, "audit_max_coordinate")
+            row = box.row(align=True)
+            row.operator("itempro.audit_transforms")
+            row.operator("itempro.export_audit")
+            counts = _audit_state["counts"]
+            for category, label in AUDIT_CATEGORIES:
+                if category not in counts:
+                    continue
+                row = box.row(align=True)
+                row.label(text=f"{label}: {counts[category]}")
+                op = row.operator("itempro.audit_select", text="Select")
+                op.category = category
+                op = row.operator("itempro.audit_fix", text="Fix")
+                op.category = category
+
+            # Proximity Tools
+            box = layout.box()
+            box.label(text="Proximity Tools:")
+            box.prop(props, "proximity_radius")
+            box.prop(props, "proximity_use_bounds")
+            row = box.row(align=True)
+            row.operator("itempro.select_within_radius")
+            row.operator("itempro.snap_to_nearest")
+            box.operator("itempro.measure_spacing")
+
 def error_handler(func):
     @functools.wraps(func)
     def wrapper(self, context):
@@ -310,6 +634,106 @@ def error_handler(func):
     return wrapper
 
 
+# Bulk transform helpers
+# bpy collections (scene.objects, bpy.data.objects) are read and written with
+# foreach_get/foreach_set in one call; plain lists fall back to a Python loop.
+def _read_vectors(objects, attr, size=3):
+    if hasattr(objects, "foreach_get"):
+        buffer = np.empty(len(objects) * size, dtype=np.float32)
+        objects.foreach_get(attr, buffer)
+        return buffer.reshape(-1, size).astype(np.float64)
+    return np.array([getattr(obj, attr)[:] for obj in objects], dtype=np.float64).reshape(-1, size)
+
+def _read_matrices(objects, attr="matrix_world"):
+    # Returned row-major as (n, 4, 4); foreach_get yields column-major floats
+    if hasattr(objects, "foreach_get"):
+        buffer = np.empty(len(objects) * 16, dtype=np.float32)
+        objects.foreach_get(attr, buffer)
+        return buffer.reshape(-1, 4, 4).transpose(0, 2, 1).astype(np.float64)
+    return np.array(
+        [[row[:] for row in getattr(obj, attr)] for obj in objects],
+        dtype=np.float64
+    ).reshape(-1, 4, 4)
+
+def _world_to_local(objects, world_locations):
+    # Local locations that put each object at its world location, for every
+    # object at once. Moved objects and all their ancestors are visited
+    # parents first, so a parent that moves is accounted for in its children.
+    index = {}
+    nodes = []
+    depths = []
+    for obj in objects:
+        chain = []
+        while obj is not None and obj not in index:
+            chain.append(obj)
+            obj = obj.parent
+        for node in reversed(chain):
+            index[node] = len(nodes)
+            nodes.append(node)
+            depths.append(depths[index[node.parent]] + 1 if node.parent else 0)
+
+    depths = np.array(depths)
+    parents = np.array([index[node.parent] if node.parent else -1 for node in nodes])
+    moved = np.zeros(len(nodes), dtype=bool)
+    rows = np.array([index[obj] for obj in objects])
+    moved[rows] = True
+
+    world = _read_matrices(nodes)
+    basis = _read_matrices(nodes, "matrix_basis")
+    parent_inverse = _read_matrices(nodes, "matrix_parent_inverse")
+    world[rows, :3, 3] = world_locations
+
+    # frames: parent world @ parent inverse, the space local transforms live in
+    frames = np.tile(np.eye(4), (len(nodes), 1, 1))
+    for depth in range(1, depths.max() + 1):
+        level = np.flatnonzero(depths == depth)
+        frames[level] = world[parents[level]] @ parent_inverse[level]
+        # Unmoved ancestors follow their own parents
+        followers = level[~moved[level]]
+        world[followers] = frames[followers] @ basis[followers]
+
+    targets = np.ones((len(objects), 4, 1))
+    targets[:, :3, 0] = world_locations
+    return np.linalg.solve(frames[rows], targets)[:, :3, 0]
+
+def _read_locations(objects, world_space=False):
+    if world_space:
+        return _read_matrices(objects)[:, :3, 3]
+    return _read_vectors(objects, "location")
+
+def _write_locations(objects, locations, world_space=False):
+    if len(objects) == 0:
+        return
+    if world_space:
+        locations = _world_to_local(objects, locations)
+    _write_vectors(objects, "location", locations)
+
+def _read_bounds_centers(objects):
+    corners = _read_vectors(objects, "bound_box", 24).reshape(-1, 8, 3)
+    matrices = _read_matrices(objects)
+    centers = corners.mean(axis=1)
+    return np.einsum('nij,nj->ni', matrices[:, :3, :3], centers) + matrices[:, :3, 3]
+
+def _count_object_users():
+    # Objects using each mesh, by pointer. mesh.users also counts ID
+    # properties (item_pro.source_mesh, proxies) so it cannot be compared
+    # against a number of objects. Reduced objects count for their full mesh.
+    users = {}
+    for obj in bpy.data.objects:
+        data = obj.item_pro.full_mesh or obj.data
+        if data is not None:
+            pointer = data.as_pointer()
+            users[pointer] = users.get(pointer, 0) + 1
+    return users
+
+def _write_vectors(objects, attr, values):
+    if hasattr(objects, "foreach_set"):
+        objects.foreach_set(attr, np.ascontiguousarray(values, dtype=np.float32).ravel())
+        return
+    for obj, value in zip(objects, values):
+        setattr(obj, attr, value.tolist())
+
+
 class ITEMPRO_OT_RandomizeProperties(bpy.types.Operator):
     bl_idname = "itempro.randomize_properties"
     bl_label = "Randomize Properties"
@@ -484,16 +908,16 @@ class ITEMPRO_OT_AlignObjects(bpy.types.Operator):
             self.report({'ERROR'}, "Select at least two objects, with one active")
             return {'CANCELLED'}
         
-        axis = context.scene.item_pro_props.align_axis
-        axis_index = {'X': 0, 'Y': 1, 'Z': 2}[axis]
-        
-        target_pos = active.location[axis_index]
-        
-        for obj in selected:
-            if obj != active:
-                loc = list(obj.location)
-                loc[axis_index] = target_pos
-                obj.location = loc
+        props = context.scene.item_pro_props
+        axis_index = {'X': 0, 'Y': 1, 'Z': 2}[props.align_axis]
+        world_space = props.respect_parenting
+
+        objects = [obj for obj in selected if obj != active]
+        target_pos = _read_locations([active], world_space)[0, axis_index]
+
+        locations = _read_locations(objects, world_space)
+        locations[:, axis_index] = target_pos
+        _write_locations(objects, locations, world_space)
         
         return {'FINISHED'}
 
@@ -510,16 +934,468 @@ class ITEMPRO_OT_StackObjects(bpy.types.Operator):
         
         props = context.scene.item_pro_props
         spacing = props.spacing
+        world_space = props.respect_parenting
         
         # Sort objects by Z location
-        sorted_objects = sorted(selected, key=lambda obj: obj.location.z)
-        base_z = sorted_objects[0].location.z
-        
-        for i, obj in enumerate(sorted_objects):
-            obj.location.z = base_z + (i * spacing)
+        locations = _read_locations(selected, world_space)
+        order = np.argsort(locations[:, 2], kind='stable')
+        sorted_objects = [selected[i] for i in order]
+        locations = locations[order]
+
+        locations[:, 2] = locations[0, 2] + np.arange(len(sorted_objects)) * spacing
+        _write_locations(sorted_objects, locations, world_space)
         
         return {'FINISHED'}
 
+# Above this many objects or slots the assignment is approximated greedily
+EXACT_ASSIGNMENT_LIMIT = 400
+
+def _hungarian(cost):
+    # Exact minimum cost assignment for rows <= columns (shortest augmenting
+    # path with potentials, O(n^3)); returns the column of every row
+    rows, cols = cost.shape
+    u = np.zeros(rows + 1)
+    v = np.zeros(cols + 1)
+    owner = np.zeros(cols + 1, dtype=np.int64)
+    way = np.zeros(cols + 1, dtype=np.int64)
+
+    for row in range(1, rows + 1):
+        owner[0] = row
+        column = 0
+        min_reduced = np.full(cols + 1, np.inf)
+        used = np.zeros(cols + 1, dtype=bool)
+        while owner[column] != 0:
+            used[column] = True
+            current = owner[column]
+            reduced = cost[current - 1] - u[current] - v[1:]
+            better = ~used[1:] & (reduced < min_reduced[1:])
+            min_reduced[1:][better] = reduced[better]
+            way[1:][better] = column
+
+            candidates = np.where(used[1:], np.inf, min_reduced[1:])
+            next_column = int(np.argmin(candidates)) + 1
+            delta = candidates[next_column - 1]
+
+            used_columns = np.flatnonzero(used)
+            u[owner[used_columns]] += delta
+            v[used_columns] -= delta
+            min_reduced[1:][~used[1:]] -= delta
+            column = next_column
+
+        # Flip the augmenting path
+        while column != 0:
+            previous = way[column]
+            owner[column] = owner[previous]
+            column = previous
+
+    assignment = np.full(rows, -1, dtype=np.int64)
+    assigned = np.flatnonzero(owner[1:])
+    assignment[owner[assigned + 1] - 1] = assigned
+    return assignment
+
+def _greedy_assignment(points, slots, neighbours=8):
+    # Candidate pairs come from a KD-tree of the free slots and are taken
+    # shortest first; objects that lose all their candidates retry with
+    # twice as many neighbours. The tree is only rebuilt once half of its
+    # slots are taken. Objects closer together than half the slot spacing
+    # share one query, so stacked or clustered starts finish in a few rounds.
+    assignment = np.full(len(points), -1, dtype=np.int64)
+    slot_taken = np.zeros(len(slots), dtype=bool)
+    padded_points = np.zeros((len(points), 3))
+    padded_points[:, :points.shape[1]] = points
+    padded_slots = np.zeros((len(slots), 3))
+    padded_slots[:, :slots.shape[1]] = slots
+
+    tree = None
+    tree_size = 0
+    free_count = len(slots)
+    cell = None
+    pending = np.arange(len(points))
+    while len(pending) and free_count:
+        if tree is None or 2 * free_count <= tree_size:
+            free = np.flatnonzero(~slot_taken)
+            tree = kdtree.KDTree(len(free))
+            for i, co in zip(free.tolist(), padded_slots[free].tolist()):
+                tree.insert(co, i)
+            tree.balance()
+            tree_size = len(free)
+
+        if cell is None:
+            # Median spacing of a sample of slots to their nearest neighbour
+            sample = padded_slots[::max(1, len(slots) // 64)].tolist()
+            spacing = [found[-1][2] for found in (tree.find_n(co, 2) for co in sample)]
+            cell = max(float(np.median(spacing)) / 2, 1e-9)
+
+        # Objects in the same cell share one query from their mean position
+        # and take its slots in turn
+        _, inverse, counts = np.unique(
+            np.floor(padded_points[pending] / cell).astype(np.int64),
+            axis=0, return_inverse=True, return_counts=True
+        )
+        inverse = inverse.ravel()
+        centers = np.stack([
+            np.bincount(inverse, weights=padded_points[pending, axis]) / counts
+            for axis in range(3)
+        ], axis=1)
+        order = np.argsort(inverse, kind='stable')
+        groups = np.split(pending[order], np.cumsum(counts)[:-1])
+        groups = [group.tolist()[::-1] for group in groups]
+
+        edges = [
+            (distance, g, slot)
+            for g, co in enumerate(centers.tolist())
+            for _, slot, distance in tree.find_n(co, min(tree_size, neighbours * len(groups[g])))
+        ]
+        edges.sort()
+        for _, g, slot in edges:
+            if groups[g] and not slot_taken[slot]:
+                assignment[groups[g].pop()] = slot
+                slot_taken[slot] = True
+                free_count -= 1
+
+        pending = pending[assignment[pending] < 0]
+        neighbours *= 2
+    return assignment
+
+def _assign_slots(points, slots):
+    # Slot index for each point so the total movement is minimal, -1 for
+    # points left over when there are fewer slots than points
+    if max(len(points), len(slots)) > EXACT_ASSIGNMENT_LIMIT:
+        return _greedy_assignment(points, slots)
+
+    cost = np.linalg.norm(points[:, None, :] - slots[None, :, :], axis=2)
+    if len(points) <= len(slots):
+        return _hungarian(cost)
+
+    assignment = np.full(len(points), -1, dtype=np.int64)
+    slot_points = _hungarian(cost.T)
+    assignment[slot_points] = np.arange(len(slots))
+    return assignment
+
+# Scripting API
+# Plain functions that take explicit objects and parameters. They skip the
+# operator machinery (context lookup, poll, undo push, redraw) and return
+# timings, so pipeline scripts can call them in loops. Once the addon is
+# enabled they are available with `import itempro`.
+def _place_in_slots(objects, slots, axes, minimize_movement, respect_parenting):
+    # slots holds the target values for the given axes, one row per slot
+    locations = _read_locations(objects, respect_parenting)
+
+    if minimize_movement:
+        assignment = _assign_slots(locations[:, axes], slots)
+    else:
+        assignment = np.arange(len(objects))
+        assignment[len(slots):] = -1
+
+    placed = np.flatnonzero(assignment >= 0)
+    locations[np.ix_(placed, axes)] = slots[assignment[placed]]
+    _write_locations(
+        [objects[i] for i in placed],
+        locations[placed],
+        respect_parenting
+    )
+
+def distribute(objects, mode='LINEAR', spacing=1.0, radius=1.0, grid_size=(3, 3),
+               random_range=(5.0, 5.0, 5.0), minimize_movement=False, respect_parenting=False):
+    start = time.perf_counter()
+    objects = list(objects)
+    count = len(objects)
+
+    if mode == 'LINEAR':
+        slots = (np.arange(count) * spacing)[:, None]
+        _place_in_slots(objects, slots, [0], minimize_movement, respect_parenting)
+    elif mode == 'CIRCULAR':
+        angles = 2 * math.pi * np.arange(count) / max(count, 1)
+        slots = np.column_stack((np.cos(angles), np.sin(angles))) * radius
+        _place_in_slots(objects, slots, [0, 1], minimize_movement, respect_parenting)
+    elif mode == 'GRID':
+        grid_x, grid_y = grid_size
+        cells = np.arange(grid_x * grid_y)
+        slots = np.column_stack((cells % grid_x, cells // grid_x)) * spacing
+        _place_in_slots(objects, slots, [0, 1], minimize_movement, respect_parenting)
+    elif mode == 'RANDOM':
+        range_x, range_y, range_z = random_range
+        locations = np.array([
+            (
+                random.uniform(-range_x, range_x),
+                random.uniform(-range_y, range_y),
+                random.uniform(-range_z, range_z)
+            )
+            for obj in objects
+        ]).reshape(-1, 3)
+        _write_locations(objects, locations, respect_parenting)
+    else:
+        raise ValueError(f"Unknown distribution mode: {mode}")
+
+    for obj in objects:
+        _mark_generated(obj)
+    return {"count": count, "seconds": time.perf_counter() - start}
+
+def _lowest_points(objects, use_bounds=False):
+    # World space lowest Z of each object's vertices, or of its bounds
+    # for objects without mesh data or when use_bounds is set
+    matrices = _read_matrices(objects)
+    if use_bounds:
+        corners = np.array([[corner[:] for corner in obj.bound_box] for obj in objects]).reshape(-1, 8, 3)
+        heights = np.einsum('nkj,nj->nk', corners, matrices[:, 2, :3]) + matrices[:, 2, 3:]
+        return heights.min(axis=1)
+
+    lowest = np.empty(len(objects))
+    for i, obj in enumerate(objects):
+        if obj.type == 'MESH' and len(obj.data.vertices):
+            co = np.empty(len(obj.data.vertices) * 3, dtype=np.float32)
+            obj.data.vertices.foreach_get("co", co)
+            points = co.reshape(-1, 3)
+        else:
+            points = np.array([corner[:] for corner in obj.bound_box])
+        lowest[i] = (points @ matrices[i, 2, :3]).min() + matrices[i, 2, 3]
+    return lowest
+
+# Terrain height grid, sampled once per terrain and resolution and dropped
+# by the depsgraph handler when the terrain moves or is edited
+_terrain_state = {"key": None, "grid": None, "bounds": None}
+
+# Upper bound on (triangle, cell) candidates tested at once while rasterizing
+RASTER_CHUNK_SIZE = 1 << 22
+
+def _rasterize_heights(co, triangles, xs, ys):
+    # Highest surface over every grid point, like a ray cast straight down.
+    # Each triangle is tested against the grid points inside its XY bounds
+    # with barycentric coordinates, all triangles of a chunk at once.
+    a, b, c = co[triangles[:, 0]], co[triangles[:, 1]], co[triangles[:, 2]]
+    area = (b[:, 1] - c[:, 1]) * (a[:, 0] - c[:, 0]) + (c[:, 0] - b[:, 0]) * (a[:, 1] - c[:, 1])
+    # Vertical faces cover no area seen from above
+    keep = np.abs(area) > 1e-12
+    a, b, c, area = a[keep], b[keep], c[keep], area[keep]
+
+    low = np.minimum(np.minimum(a, b), c)
+    high = np.maximum(np.maximum(a, b), c)
+    first_column = np.searchsorted(xs, low[:, 0], 'left')
+    first_row = np.searchsorted(ys, low[:, 1], 'left')
+    widths = np.searchsorted(xs, high[:, 0], 'right') - first_column
+    counts = widths * (np.searchsorted(ys, high[:, 1], 'right') - first_row)
+    ends = np.cumsum(counts)
+
+    heights = np.full(len(xs) * len(ys), -np.inf)
+    start = 0
+    while start < len(counts):
+        base = ends[start] - counts[start]
+        stop = max(start + 1, int(np.searchsorted(ends, base + RASTER_CHUNK_SIZE, 'right')))
+        tri = np.repeat(np.arange(start, stop), counts[start:stop])
+        offset = base + np.arange(len(tri)) - np.repeat(ends[start:stop] - counts[start:stop], counts[start:stop])
+        columns = first_column[tri] + offset % widths[tri]
+        rows = first_row[tri] + offset // widths[tri]
+        start = stop
+
+        px = xs[columns] - c[tri, 0]
+        py = ys[rows] - c[tri, 1]
+        u = ((b[tri, 1] - c[tri, 1]) * px + (c[tri, 0] - b[tri, 0]) * py) / area[tri]
+        v = ((c[tri, 1] - a[tri, 1]) * px + (a[tri, 0] - c[tri, 0]) * py) / area[tri]
+        w = 1.0 - u - v
+        inside = (u >= -1e-9) & (v >= -1e-9) & (w >= -1e-9)
+        z = u * a[tri, 2] + v * b[tri, 2] + w * c[tri, 2]
+        np.maximum.at(heights, rows[inside] * len(xs) + columns[inside], z[inside])
+
+    heights[np.isinf(heights)] = np.nan
+    return heights.reshape(len(ys), len(xs))
+
+def _get_height_grid(terrain, resolution):
+    key = (terrain.as_pointer(), resolution)
+    if _terrain_state["key"] == key:
+        return _terrain_state["grid"], _terrain_state["bounds"]
+
+    depsgraph = bpy.context.evaluated_depsgraph_get()
+    evaluated = terrain.evaluated_get(depsgraph)
+    mesh = evaluated.to_mesh()
+    mesh.calc_loop_triangles()
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    triangles = np.empty(len(mesh.loop_triangles) * 3, dtype=np.int32)
+    mesh.loop_triangles.foreach_get("vertices", triangles)
+    evaluated.to_mesh_clear()
+
+    matrix = np.array([row[:] for row in terrain.matrix_world])
+    co = co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+
+    # The resolution applies to the longer side; the shorter one gets as
+    # many samples as keep the cells square
+    min_x, min_y, _ = co.min(axis=0)
+    max_x, max_y, _ = co.max(axis=0)
+    cell = max(max_x - min_x, max_y - min_y, 1e-9) / (resolution - 1)
+    xs = np.linspace(min_x, max_x, max(2, int(round((max_x - min_x) / cell)) + 1))
+    ys = np.linspace(min_y, max_y, max(2, int(round((max_y - min_y) / cell)) + 1))
+    grid = _rasterize_heights(co, triangles.reshape(-1, 3), xs, ys)
+
+    bounds = (min_x, min_y, max_x, max_y)
+    _terrain_state.update(key=key, grid=grid, bounds=bounds)
+    return grid, bounds
+
+def _sample_heights(grid, bounds, points):
+    # Bilinear lookup for every (x, y) at once; NaN outside the terrain
+    min_x, min_y, max_x, max_y = bounds
+    rows, columns = grid.shape
+    fx = (points[:, 0] - min_x) / max(max_x - min_x, 1e-9) * (columns - 1)
+    fy = (points[:, 1] - min_y) / max(max_y - min_y, 1e-9) * (rows - 1)
+    outside = (fx < 0) | (fx > columns - 1) | (fy < 0) | (fy > rows - 1)
+
+    x0 = np.clip(np.floor(fx), 0, columns - 2).astype(np.int64)
+    y0 = np.clip(np.floor(fy), 0, rows - 2).astype(np.int64)
+    tx = np.clip(fx - x0, 0.0, 1.0)
+    ty = np.clip(fy - y0, 0.0, 1.0)
+    heights = (
+        grid[y0, x0] * (1 - tx) * (1 - ty)
+        + grid[y0, x0 + 1] * tx * (1 - ty)
+        + grid[y0 + 1, x0] * (1 - tx) * ty
+        + grid[y0 + 1, x0 + 1] * tx * ty
+    )
+    heights[outside] = np.nan
+    return heights
+
+def place_on_ground(objects, respect_parenting=False, terrain=None, resolution=256):
+    # Without a terrain the ground is the Z=0 plane. With one, the ground
+    # height under each origin comes from the terrain's cached height grid
+    # and lowest points use bounding boxes; objects off the terrain stay put.
+    start = time.perf_counter()
+    objects = [obj for obj in objects if obj != terrain]
+
+    # Move objects up by their lowest point
+    locations = _read_locations(objects, respect_parenting)
+    if terrain is None:
+        locations[:, 2] -= _lowest_points(objects)
+    else:
+        grid, bounds = _get_height_grid(terrain, resolution)
+        origins = _read_matrices(objects)[:, :3, 3]
+        ground = _sample_heights(grid, bounds, origins)
+        found = ~np.isnan(ground)
+        objects = [obj for obj, keep in zip(objects, found.tolist()) if keep]
+        locations = locations[found]
+        locations[:, 2] += ground[found] - _lowest_points(objects, use_bounds=True)
+
+    _write_locations(objects, locations, respect_parenting)
+    return {"count": len(objects), "seconds": time.perf_counter() - start}
+
+def _origin_set(objects, **kwargs):
+    if hasattr(bpy.context, "temp_override"):
+        with bpy.context.temp_override(selected_editable_objects=objects):
+            bpy.ops.object.origin_set(**kwargs)
+    else:
+        bpy.ops.object.origin_set({"selected_editable_objects": objects}, **kwargs)
+
+def _set_origin_fallback(objects, pivot, location):
+    # Curves, text and metaballs go through object.origin_set, one object
+    # at a time for the bottom and top since each needs its own target
+    cursor = bpy.context.scene.cursor
+    saved = cursor.location.copy()
+    try:
+        if pivot == 'CENTER':
+            _origin_set(objects, type='ORIGIN_GEOMETRY', center='BOUNDS')
+        elif pivot == 'CURSOR':
+            cursor.location = location
+            _origin_set(objects, type='ORIGIN_CURSOR')
+        else:
+            for obj in objects:
+                heights = [(obj.matrix_world @ Vector(corner)).z for corner in obj.bound_box]
+                point = obj.matrix_world.translation.copy()
+                point.z = min(heights) if pivot == 'BOTTOM' else max(heights)
+                cursor.location = point
+                _origin_set([obj], type='ORIGIN_CURSOR')
+    finally:
+        cursor.location = saved
+
+def set_origin(objects, pivot='CENTER', location=None):
+    # Moves the origin of mesh objects to the bounds center, the bottom or
+    # top of the bounds below/above the origin, or a world location (the
+    # 3D cursor by default). Other object types with data fall back to
+    # object.origin_set; empties, and meshes shared by objects that would
+    # need different offsets, are skipped.
+    start = time.perf_counter()
+    if pivot not in {'CENTER', 'BOTTOM', 'TOP', 'CURSOR'}:
+        raise ValueError(f"Unknown pivot: {pivot}")
+    if location is None:
+        location = bpy.context.scene.cursor.location[:]
+
+    objects = list(objects)
+    meshes = [obj for obj in objects if obj.type == 'MESH']
+    others = [obj for obj in objects if obj.type != 'MESH' and obj.data is not None]
+    skipped = len(objects) - len(meshes) - len(others)
+    if others:
+        _set_origin_fallback(others, pivot, location)
+    if not meshes:
+        return {"count": len(others), "skipped": skipped, "seconds": time.perf_counter() - start}
+    _restore_full_detail(meshes)
+
+    matrices = _read_matrices(meshes)
+    corners = _read_vectors(meshes, "bound_box", 24).reshape(-1, 8, 3)
+    valid = np.abs(np.linalg.det(matrices[:, :3, :3])) > 1e-12
+    matrices[~valid] = np.eye(4)
+
+    if pivot == 'CENTER':
+        offsets = (corners.min(axis=1) + corners.max(axis=1)) / 2
+    else:
+        if pivot in {'BOTTOM', 'TOP'}:
+            heights = np.einsum('nkj,nj->nk', corners, matrices[:, 2, :3]) + matrices[:, 2, 3:]
+            points = matrices[:, :3, 3].copy()
+            points[:, 2] = heights.min(axis=1) if pivot == 'BOTTOM' else heights.max(axis=1)
+        else:
+            points = np.tile(np.asarray(location, dtype=np.float64), (len(meshes), 1))
+        targets = np.ones((len(meshes), 4, 1))
+        targets[:, :3, 0] = points
+        offsets = np.linalg.solve(matrices, targets)[:, :3, 0]
+
+    groups = {}
+    for i, obj in enumerate(meshes):
+        groups.setdefault(obj.data.as_pointer(), []).append(i)
+
+    users = _count_object_users()
+    moved = len(others)
+    for pointer, rows in groups.items():
+        mesh = meshes[rows[0]].data
+        offset = offsets[rows[0]]
+        if (users[pointer] != len(rows) or not valid[rows].all()
+                or not np.allclose(offsets[rows], offset, atol=1e-6)):
+            skipped += len(rows)
+            continue
+
+        co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+        mesh.vertices.foreach_get("co", co)
+        co = co.reshape(-1, 3) - offset
+        mesh.vertices.foreach_set("co", co.astype(np.float32).ravel())
+        mesh.update()
+        _geometry_edited(mesh, [meshes[i] for i in rows])
+
+        # Compensate the object and its children for the shifted geometry
+        shift = Matrix.Translation(offset.tolist())
+        unshift = Matrix.Translation((-offset).tolist())
+        for i in rows:
+            obj = meshes[i]
+            for child in obj.children:
+                child.matrix_parent_inverse = unshift @ child.matrix_parent_inverse
+            obj.matrix_world = Matrix(matrices[i].tolist()) @ shift
+            moved += 1
+
+    return {"count": moved, "skipped": skipped, "seconds": time.perf_counter() - start}
+
+def array(obj, count=5, offset=(0.0, 0.0, 1.0), collection=None, linked=False):
+    start = time.perf_counter()
+    if collection is None:
+        collection = obj.users_collection[0] if obj.users_collection else bpy.context.scene.collection
+
+    created = []
+    for i in range(count):
+        new_obj = obj.copy()
+        if not linked and obj.data is not None:
+            new_obj.data = obj.data.copy()
+        new_obj.location = (
+            obj.location[0] + offset[0] * i,
+            obj.location[1] + offset[1] * i,
+            obj.location[2] + offset[2] * i
+        )
+        _mark_generated(new_obj, obj.data)
+        collection.objects.link(new_obj)
+        created.append(new_obj)
+
+    return {"objects": created, "count": count, "seconds": time.perf_counter() - start}
+
 class ITEMPRO_OT_DistributeObjects(bpy.types.Operator):
     bl_idname = "itempro.distribute_objects"
     bl_label = "Distribute Objects"
@@ -532,60 +1408,127 @@ class ITEMPRO_OT_DistributeObjects(bpy.types.Operator):
             return {'CANCELLED'}
         
         props = context.scene.item_pro_props
-        
-        if props.distribution_type == 'LINEAR':
-            self.distribute_linear(context, selected)
-        elif props.distribution_type == 'CIRCULAR':
-            self.distribute_circular(context, selected)
-        elif props.distribution_type == 'GRID':
-            self.distribute_grid(context, selected)
-        elif props.distribution_type == 'RANDOM':
-            self.distribute_random(context, selected)
+        distribute(
+            selected,
+            mode=props.distribution_type,
+            spacing=props.spacing,
+            radius=props.radius,
+            grid_size=props.grid_size[:],
+            random_range=props.random_range[:],
+            minimize_movement=props.minimize_movement,
+            respect_parenting=props.respect_parenting
+        )
+
+        if props.budget_enabled:
+            _evaluate_budget(context.scene, force=True)
         
         return {'FINISHED'}
-    
-    def distribute_linear(self, context, objects):
-        props = context.scene.item_pro_props
-        spacing = props.spacing
-        
-        for i, obj in enumerate(objects):
-            obj.location[0] = i * spacing
-    
-    def distribute_circular(self, context, objects):
-        props = context.scene.item_pro_props
-        radius = props.radius
-        count = len(objects)
-        
-        for i, obj in enumerate(objects):
-            angle = (2 * math.pi * i) / count
-            obj.location[0] = math.cos(angle) * radius
-            obj.location[1] = math.sin(angle) * radius
-    
-    def distribute_grid(self, context, objects):
-        props = context.scene.item_pro_props
-        spacing = props.spacing
-        grid_x, grid_y = props.grid_size
-        
-        for i, obj in enumerate(objects):
-            if i >= grid_x * grid_y:
-                break
-            
-            row = i // grid_x
-            col = i % grid_x
-            
-            obj.location[0] = col * spacing
-            obj.location[1] = row * spacing
-    
-    def distribute_random(self, context, objects):
-        props = context.scene.item_pro_props
-        range_x, range_y, range_z = props.random_range
-        
-        for obj in objects:
-            obj.location = (
-                random.uniform(-range_x, range_x),
-                random.uniform(-range_y, range_y),
-                random.uniform(-range_z, range_z)
-            )
+
+def _iter_placement_chunks(filepath, chunk_size, stats):
+    # Yields (asset names, (n, 9) location/rotation/scale array) per chunk,
+    # so only one chunk of the file is held in memory at a time. Rows that
+    # cannot be read are counted in stats["malformed"].
+    stats["malformed"] = 0
+    if filepath.lower().endswith(".npy"):
+        data = np.load(filepath, mmap_mode='r')
+        for start in range(0, len(data), chunk_size):
+            chunk = data[start:start + chunk_size]
+            names = chunk['asset']
+            if names.dtype.kind == 'S':
+                names = np.char.decode(names, 'utf-8')
+            transforms = np.hstack((
+                np.asarray(chunk['location'], dtype=np.float64).reshape(-1, 3),
+                np.asarray(chunk['rotation'], dtype=np.float64).reshape(-1, 3),
+                np.asarray(chunk['scale'], dtype=np.float64).reshape(-1, 3),
+            ))
+            yield names.tolist(), transforms
+        return
+
+    with open(filepath, newline='') as file:
+        names = []
+        rows = []
+        first = True
+        for row in csv.reader(file):
+            if not row or row[0].startswith('#'):
+                continue
+            try:
+                if len(row) < 10:
+                    raise ValueError
+                values = [float(value) for value in row[1:10]]
+            except ValueError:
+                # Only the first row may be a header
+                if not first:
+                    stats["malformed"] += 1
+                first = False
+                continue
+            first = False
+            names.append(row[0].strip())
+            rows.append(values)
+            if len(rows) == chunk_size:
+                yield names, np.array(rows, dtype=np.float64)
+                names = []
+                rows = []
+        if rows:
+            yield names, np.array(rows, dtype=np.float64)
+
+class ITEMPRO_OT_ImportPlacements(bpy.types.Operator, ImportHelper):
+    bl_idname = "itempro.import_placements"
+    bl_label = "Import Placements"
+    bl_description = "Create linked instances of scene objects from a CSV or NPY placement file"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    filter_glob: bpy.props.StringProperty(
+        default="*.csv;*.npy",
+        options={'HIDDEN'}
+    )
+
+    chunk_size: bpy.props.IntProperty(
+        name="Chunk Size",
+        description="Rows read and created per batch",
+        default=10000,
+        min=100
+    )
+
+    @error_handler
+    def execute(self, context):
+        base_name = os.path.splitext(os.path.basename(self.filepath))[0]
+        target = bpy.data.collections.new(base_name)
+        context.scene.collection.children.link(target)
+
+        # Asset names are resolved once, not once per row
+        sources = {}
+        stats = {}
+        created = 0
+        skipped = 0
+
+        for names, transforms in _iter_placement_chunks(self.filepath, self.chunk_size, stats):
+            # Converted once per chunk, then assigned while each instance is
+            # created since the loop visits it anyway
+            transforms[:, 3:6] = np.radians(transforms[:, 3:6])
+            for name, values in zip(names, transforms.tolist()):
+                if name not in sources:
+                    sources[name] = bpy.data.objects.get(name)
+                source = sources[name]
+                if source is None:
+                    skipped += 1
+                    continue
+                instance = source.copy()
+                instance.location = values[0:3]
+                instance.rotation_euler = values[3:6]
+                instance.scale = values[6:9]
+                _mark_generated(instance, source.data)
+                target.objects.link(instance)
+                created += 1
+
+        missing = sorted(name for name, source in sources.items() if source is None)
+        if missing:
+            self.report({'WARNING'}, f"Skipped {skipped} row(s), unknown assets: {', '.join(missing[:5])}")
+        if stats.get("malformed"):
+            self.report({'WARNING'}, f"Skipped {stats['malformed']} malformed row(s)")
+        if context.scene.item_pro_props.budget_enabled:
+            _evaluate_budget(context.scene, force=True)
+        self.report({'INFO'}, f"Created {created} instance(s)")
+        return {'FINISHED'}
 
 class ITEMPRO_OT_MirrorObject(bpy.types.Operator):
     bl_idname = "itempro.mirror_object"
@@ -625,6 +1568,131 @@ class ITEMPRO_OT_ApplyUniformScale(bpy.types.Operator):
         obj.scale = (scale, scale, scale)
         return {'FINISHED'}
 
+def _transform_points(points, matrix):
+    co = np.empty(len(points) * 3, dtype=np.float32)
+    points.foreach_get("co", co)
+    co = co.reshape(-1, 3) @ matrix[:3, :3].T + matrix[:3, 3]
+    points.foreach_set("co", co.astype(np.float32).ravel())
+
+def _face_corners(mesh):
+    # (face, vertex) of every corner as one integer key
+    vertices = np.empty(len(mesh.loops), dtype=np.int64)
+    mesh.loops.foreach_get("vertex_index", vertices)
+    totals = np.empty(len(mesh.polygons), dtype=np.int64)
+    mesh.polygons.foreach_get("loop_total", totals)
+    faces = np.repeat(np.arange(len(totals)), totals)
+    return faces * len(mesh.vertices) + vertices
+
+def _bake_mesh(mesh, matrix):
+    # Custom normals are read before the vertices move, then transformed
+    # by the inverse transpose and written back once the geometry is baked
+    normals = None
+    if mesh.has_custom_normals:
+        normals = np.empty(len(mesh.loops) * 3, dtype=np.float32)
+        if hasattr(mesh, "corner_normals"):
+            mesh.corner_normals.foreach_get("vector", normals)
+        else:
+            mesh.calc_normals_split()
+            mesh.loops.foreach_get("normal", normals)
+        normals = normals.reshape(-1, 3) @ np.linalg.inv(matrix[:3, :3])
+        normals /= np.maximum(np.linalg.norm(normals, axis=1, keepdims=True), 1e-12)
+
+    # Shape keys hold their own copy of every vertex, the basis included,
+    # and would undo the bake on the next update if left untouched
+    _transform_points(mesh.vertices, matrix)
+    if mesh.shape_keys is not None:
+        for block in mesh.shape_keys.key_blocks:
+            _transform_points(block.data, matrix)
+
+    # Mirroring turns faces inside out, reverse the winding to fix it
+    if np.linalg.det(matrix[:3, :3]) < 0:
+        before = _face_corners(mesh) if normals is not None else None
+        if hasattr(mesh, "flip_normals"):
+            mesh.flip_normals()
+        else:
+            bm = bmesh.new()
+            bm.from_mesh(mesh)
+            bmesh.ops.reverse_faces(bm, faces=bm.faces[:])
+            bm.to_mesh(mesh)
+            bm.free()
+
+        # Reversing the winding reorders the corners of every face, so move
+        # each normal to the corner that now holds its vertex
+        if before is not None:
+            order = np.argsort(before, kind='stable')
+            after = _face_corners(mesh)
+            normals = normals[order[np.searchsorted(before[order], after)]]
+
+    if normals is not None:
+        mesh.normals_split_custom_set(normals.tolist())
+    mesh.update()
+
+def _apply_transforms(objects, apply_location=True):
+    _restore_full_detail(objects)
+    applied = _read_matrices(objects, "matrix_basis")
+    if not apply_location:
+        applied[:, :3, 3] = 0.0
+
+    # Objects sharing a mesh with the same matrix are baked once
+    groups = {}
+    for obj, matrix in zip(objects, applied):
+        key = (obj.data.as_pointer(), np.round(matrix, 6).tobytes())
+        groups.setdefault(key, (matrix, []))[1].append(obj)
+
+    users = _count_object_users()
+    for matrix, members in groups.values():
+        mesh = members[0].data
+        # Other users would be transformed too, give this group its own copy.
+        # Earlier groups move to copies first, so the last one keeps the original.
+        pointer = mesh.as_pointer()
+        if users[pointer] > len(members):
+            users[pointer] -= len(members)
+            mesh = mesh.copy()
+            for obj in members:
+                obj.data = mesh
+        _bake_mesh(mesh, matrix)
+        _geometry_edited(mesh, members)
+
+    for obj, matrix in zip(objects, applied):
+        # Children keep their world transform
+        for child in obj.children:
+            child.matrix_parent_inverse = Matrix(matrix.tolist()) @ child.matrix_parent_inverse
+        # matrix_basis includes the delta transforms, reset them too
+        if apply_location:
+            obj.location = (0.0, 0.0, 0.0)
+            obj.delta_location = (0.0, 0.0, 0.0)
+        obj.rotation_euler = (0.0, 0.0, 0.0)
+        obj.rotation_quaternion = (1.0, 0.0, 0.0, 0.0)
+        obj.rotation_axis_angle = (0.0, 0.0, 1.0, 0.0)
+        obj.scale = (1.0, 1.0, 1.0)
+        obj.delta_rotation_euler = (0.0, 0.0, 0.0)
+        obj.delta_rotation_quaternion = (1.0, 0.0, 0.0, 0.0)
+        obj.delta_scale = (1.0, 1.0, 1.0)
+
+    return len(groups)
+
+class ITEMPRO_OT_ApplyTransforms(bpy.types.Operator):
+    bl_idname = "itempro.apply_transforms"
+    bl_label = "Apply Transforms"
+    bl_description = "Bake rotation and scale (and optionally location) of the selected meshes into their geometry"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    apply_location: bpy.props.BoolProperty(
+        name="Location",
+        description="Also bake the location",
+        default=True
+    )
+
+    def execute(self, context):
+        objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if not objects:
+            self.report({'ERROR'}, "No mesh objects selected")
+            return {'CANCELLED'}
+
+        bakes = _apply_transforms(objects, self.apply_location)
+        self.report({'INFO'}, f"Applied transforms to {len(objects)} object(s), {bakes} mesh bake(s)")
+        return {'FINISHED'}
+
 class ITEMPRO_OT_ResetScale(bpy.types.Operator):
     bl_idname = "itempro.reset_scale"
     bl_label = "Reset Scale"
@@ -668,6 +1736,80 @@ class ITEMPRO_OT_RandomRotate(bpy.types.Operator):
             )
         return {'FINISHED'}
 
+def _bake_fcurve(obj, data_path, index, co, rest_key):
+    # Replace the curve and fill all keyframes with two buffer writes
+    # instead of one keyframe_insert call per frame. co holds frame/offset
+    # pairs; offsets are added to the rest value, read from key rest_key of
+    # the curve being replaced (the key whose offset is zero) so re-baking
+    # does not stack on the animated value of the current frame.
+    if obj.animation_data is None:
+        obj.animation_data_create()
+    anim = obj.animation_data
+    if anim.action is None:
+        anim.action = bpy.data.actions.new(f"{obj.name}Action")
+    elif anim.action.users - anim.action.use_fake_user > 1:
+        # Copies made with obj.copy() share the action, give this one its own
+        anim.action = anim.action.copy()
+
+    fcurves = anim.action.fcurves
+    fcurve = fcurves.find(data_path, index=index)
+    base = getattr(obj, data_path)[index]
+    if fcurve:
+        keys = fcurve.keyframe_points
+        if len(keys):
+            base = fcurve.evaluate(keys[rest_key].co[0])
+        fcurves.remove(fcurve)
+    fcurve = fcurves.new(data_path, index=index)
+    co[1::2] += base
+
+    count = len(co) // 2
+    points = fcurve.keyframe_points
+    points.add(count)
+    points.foreach_set("co", co)
+    # Keys are baked per frame, so linear interpolation is exact
+    points.foreach_set("interpolation", np.ones(count, dtype=np.int32))
+    fcurve.update()
+
+class ITEMPRO_OT_BakeAnimation(bpy.types.Operator):
+    bl_idname = "itempro.bake_animation"
+    bl_label = "Bake Animation"
+    bl_description = "Bake a turntable or build up animation for every selected object"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        selected = context.selected_objects
+        if not selected:
+            self.report({'ERROR'}, "No objects selected")
+            return {'CANCELLED'}
+
+        props = context.scene.item_pro_props
+        axis_index = {'X': 0, 'Y': 1, 'Z': 2}[props.align_axis]
+        objects = sorted(selected, key=lambda obj: obj.location[axis_index])
+
+        count = props.anim_frame_count
+        frames = props.anim_frame_start + np.arange(count, dtype=np.float64)
+
+        # The rest pose is the first key of a turntable and the last of a
+        # build up
+        if props.anim_type == 'TURNTABLE':
+            data_path, index, rest_key = "rotation_euler", 2, 0
+            # Stop one step short of a full turn so the loop does not hold
+            curve = np.arange(count) / count * 2 * math.pi
+        else:
+            data_path, index, rest_key = "location", 2, -1
+            t = np.linspace(0.0, 1.0, count)
+            eased = t * t * (3.0 - 2.0 * t)
+            curve = -props.anim_build_height * (1.0 - eased)
+
+        co = np.empty(count * 2, dtype=np.float32)
+        for i, obj in enumerate(objects):
+            co[0::2] = frames + i * props.anim_time_offset
+            co[1::2] = curve
+            _bake_fcurve(obj, data_path, index, co, rest_key)
+
+        self.report({'INFO'}, f"Baked {count} frames for {len(objects)} object(s)")
+        return {'FINISHED'}
+
 class ITEMPRO_OT_CreateArray(bpy.types.Operator):
     bl_idname = "itempro.create_array"
     bl_label = "Create Array"
@@ -680,21 +1822,40 @@ class ITEMPRO_OT_CreateArray(bpy.types.Operator):
             return {'CANCELLED'}
         
         props = context.scene.item_pro_props
-        offset = props.duplication_offset
-        
-        for i in range(props.duplication_count):
-            new_obj = obj.copy()
-            new_obj.data = obj.data.copy()
-            new_obj.location = (
-                obj.location[0] + offset[0] * i,
-                obj.location[1] + offset[1] * i,
-                obj.location[2] + offset[2] * i
-            )
-            context.collection.objects.link(new_obj)
-        
+        array(
+            obj,
+            count=props.duplication_count,
+            offset=props.duplication_offset[:],
+            collection=context.collection
+        )
+
+        if props.budget_enabled:
+            _evaluate_budget(context.scene, force=True)
         return {'FINISHED'}
 
 
+def _mirror_transform(source, mirror, axis):
+    # Copy the source transform onto the mirror, flipped across the axis.
+    # Values are compared first so syncing an unchanged pair does not
+    # tag the mirror for another depsgraph update.
+    axis_index = {'X': 0, 'Y': 1, 'Z': 2}[axis]
+    location = source.location.copy()
+    location[axis_index] = -location[axis_index]
+
+    # Reflecting a rotation across the plane keeps the angle about the
+    # mirror axis and negates the other two, whatever the Euler order
+    rotation = source.rotation_euler.copy()
+    for i in range(3):
+        if i != axis_index:
+            rotation[i] = -rotation[i]
+
+    if mirror.location[:] != location[:]:
+        mirror.location = location
+    if mirror.rotation_euler[:] != rotation[:] or mirror.rotation_euler.order != rotation.order:
+        mirror.rotation_euler = rotation
+    if mirror.scale[:] != source.scale[:]:
+        mirror.scale = source.scale
+
 class ITEMPRO_OT_CreateSymmetry(bpy.types.Operator):
     bl_idname = "itempro.create_symmetry"
     bl_label = "Create Symmetry"
@@ -705,21 +1866,47 @@ class ITEMPRO_OT_CreateSymmetry(bpy.types.Operator):
         if not obj:
             self.report({'ERROR'}, "No active object")
             return {'CANCELLED'}
-        
-        axis = context.scene.item_pro_props.mirror_axis
+
+        props = context.scene.item_pro_props
+        axis = props.mirror_axis
         new_obj = obj.copy()
         new_obj.data = obj.data.copy()
-        
-        if axis == 'X':
-            new_obj.location.x = -obj.location.x
-        elif axis == 'Y':
-            new_obj.location.y = -obj.location.y
-        elif axis == 'Z':
-            new_obj.location.z = -obj.location.z
-            
+        _mirror_transform(obj, new_obj, axis)
+
         context.collection.objects.link(new_obj)
+
+        if props.live_symmetry:
+            link = props.symmetry_links.add()
+            link.source = obj
+            link.mirror = new_obj
+            link.axis = axis
+            _symmetry_state["dirty"] = True
         return {'FINISHED'}
-    
+
+class ITEMPRO_OT_UnlinkSymmetry(bpy.types.Operator):
+    bl_idname = "itempro.unlink_symmetry"
+    bl_label = "Unlink Symmetry"
+    bl_description = "Stop live syncing for symmetry pairs involving the selected objects"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        links = context.scene.item_pro_props.symmetry_links
+        selected = set(context.selected_objects)
+
+        # Walk backwards so removals do not shift pending indices;
+        # pairs whose objects were deleted are dropped as well
+        removed = 0
+        for i in reversed(range(len(links))):
+            link = links[i]
+            if (not link.source or not link.mirror
+                    or link.source in selected or link.mirror in selected):
+                links.remove(i)
+                removed += 1
+
+        _symmetry_state["dirty"] = True
+        self.report({'INFO'}, f"Removed {removed} symmetry link(s)")
+        return {'FINISHED'}
+
 class ITEMPRO_OT_ApplyDimensions(bpy.types.Operator):
     bl_idname = "itempro.apply_dimensions"
     bl_label = "Apply Dimensions"
@@ -733,32 +1920,66 @@ class ITEMPRO_OT_ApplyDimensions(bpy.types.Operator):
             self.report({'ERROR'}, "No active object")
             return {'CANCELLED'}
 
-        # Store original dimensions
-        original_dims = obj.dimensions[:]
-
-        # Calculate scale factors
-        new_dims = props.dimensions
-        scale_factors = [
-            new_dims[i] / original_dims[i] if original_dims[i] != 0 else 1.0
-            for i in range(3)
-        ]
-
-        # Apply scaling based on lock status and proportional constraint
-        if props.constrain_proportional:
-            # Find the average scale factor of unlocked dimensions
-            unlocked_scales = [
-                scale_factors[i]
+        objects = context.selected_objects or [obj]
+        for target in objects:
+            # Live constrained objects keep cached unit dimensions,
+            # which avoids a bounding box evaluation per object
+            item = target.item_pro
+            if item.live_constraints:
+                original_dims = [item.unit_dimensions[i] * abs(target.scale[i]) for i in range(3)]
+            else:
+                original_dims = target.dimensions[:]
+
+            # Calculate scale factors
+            new_dims = props.dimensions
+            scale_factors = [
+                new_dims[i] / original_dims[i] if original_dims[i] != 0 else 1.0
                 for i in range(3)
-                if not props.lock_dimensions[i]
             ]
-            if unlocked_scales:
-                avg_scale = sum(unlocked_scales) / len(unlocked_scales)
-                scale_factors = [avg_scale] * 3
 
-        # Apply scale factors
-        for i in range(3):
-            if not props.lock_dimensions[i]:
-                obj.scale[i] *= scale_factors[i]
+            # Apply scaling based on lock status and proportional constraint
+            if props.constrain_proportional:
+                # Find the average scale factor of unlocked dimensions
+                unlocked_scales = [
+                    scale_factors[i]
+                    for i in range(3)
+                    if not props.lock_dimensions[i]
+                ]
+                if unlocked_scales:
+                    avg_scale = sum(unlocked_scales) / len(unlocked_scales)
+                    scale_factors = [avg_scale] * 3
+
+            # Apply scale factors
+            for i in range(3):
+                if not props.lock_dimensions[i]:
+                    target.scale[i] *= scale_factors[i]
+
+            if item.live_constraints:
+                _capture_constraint_base(target, item.unit_dimensions[:])
+
+        return {'FINISHED'}
+
+class ITEMPRO_OT_SetLiveConstraints(bpy.types.Operator):
+    bl_idname = "itempro.set_live_constraints"
+    bl_label = "Live Constraints"
+    bl_description = "Apply dimension locks and proportional constraints while the selected objects are edited"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    enable: bpy.props.BoolProperty(
+        name="Enable",
+        default=True
+    )
+
+    def execute(self, context):
+        objects = context.selected_objects
+        if not objects:
+            self.report({'ERROR'}, "No objects selected")
+            return {'CANCELLED'}
+
+        for obj in objects:
+            obj.item_pro.live_constraints = self.enable
+            if self.enable:
+                _capture_constraint_base(obj)
 
         return {'FINISHED'}
 
@@ -787,13 +2008,21 @@ class ITEMPRO_OT_PlaceOnGround(bpy.types.Operator):
         if not obj:
             self.report({'ERROR'}, "No active object")
             return {'CANCELLED'}
-            
-        # Get the lowest point of the object
-        lowest_point = min((obj.matrix_world @ Vector(v.co) for v in obj.data.vertices), key=lambda v: v.z).z
-        
-        # Move object up by its lowest point
-        obj.location.z -= lowest_point
-        
+
+        props = context.scene.item_pro_props
+        terrain = None
+        if props.ground_mode == 'TERRAIN':
+            terrain = props.terrain_object
+            if terrain is None:
+                self.report({'ERROR'}, "No terrain object set")
+                return {'CANCELLED'}
+
+        place_on_ground(
+            context.selected_objects or [obj],
+            respect_parenting=props.respect_parenting,
+            terrain=terrain,
+            resolution=props.terrain_resolution
+        )
         return {'FINISHED'}
 
 class ITEMPRO_OT_SetPivot(bpy.types.Operator):
@@ -818,31 +2047,13 @@ class ITEMPRO_OT_SetPivot(bpy.types.Operator):
             self.report({'ERROR'}, "No active object")
             return {'CANCELLED'}
             
-        if self.pivot_type == 'CENTER':
-            bpy.ops.object.origin_set(type='ORIGIN_GEOMETRY', center='BOUNDS')
-        elif self.pivot_type == 'BOTTOM':
-            # Save current cursor location
-            cursor_loc = context.scene.cursor.location.copy()
-            # Get object bounds
-            bounds = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-            lowest_z = min(v.z for v in bounds)
-            # Set cursor to bottom center
-            context.scene.cursor.location = obj.location
-            context.scene.cursor.location.z = lowest_z
-            # Set origin to cursor
-            bpy.ops.object.origin_set(type='ORIGIN_CURSOR')
-            # Restore cursor location
-            context.scene.cursor.location = cursor_loc
-        elif self.pivot_type == 'TOP':
-            cursor_loc = context.scene.cursor.location.copy()
-            bounds = [obj.matrix_world @ Vector(corner) for corner in obj.bound_box]
-            highest_z = max(v.z for v in bounds)
-            context.scene.cursor.location = obj.location
-            context.scene.cursor.location.z = highest_z
-            bpy.ops.object.origin_set(type='ORIGIN_CURSOR')
-            context.scene.cursor.location = cursor_loc
-        elif self.pivot_type == 'CURSOR':
-            bpy.ops.object.origin_set(type='ORIGIN_CURSOR')
+        result = set_origin(
+            context.selected_objects or [obj],
+            pivot=self.pivot_type,
+            location=context.scene.cursor.location[:]
+        )
+        if result["skipped"]:
+            self.report({'WARNING'}, f"Skipped {result['skipped']} empty or shared object(s)")
             
         return {'FINISHED'}
 
@@ -893,10 +2104,709 @@ class ITEMPRO_OT_PrecisionTransform(bpy.types.Operator):
         elif self.transform_type == 'SCALE':
             obj.scale[axis_index] += self.value * precision
 
-        return {'FINISHED'}    
+        return {'FINISHED'}
+
+
+class ITEMPRO_OT_FindDuplicates(bpy.types.Operator):
+    bl_idname = "itempro.find_duplicates"
+    bl_label = "Find Duplicates"
+    bl_description = "Find objects stacked at the same transform with the same data"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    scope: bpy.props.EnumProperty(
+        name="Scope",
+        items=[
+            ('SELECTED', 'Selected', 'Search the selected objects'),
+            ('SCENE', 'Scene', 'Search every object in the view layer'),
+        ],
+        default='SCENE'
+    )
+
+    action: bpy.props.EnumProperty(
+        name="Action",
+        items=[
+            ('SELECT', 'Select', 'Select the duplicates'),
+            ('REPORT', 'Report', 'Only report the duplicates'),
+            ('DELETE', 'Delete', 'Delete the duplicates'),
+        ],
+        default='SELECT'
+    )
+
+    def invoke(self, context, event):
+        # Deleting across the whole scene is easy to trigger from the panel
+        if self.action == 'DELETE' and self.scope == 'SCENE':
+            return context.window_manager.invoke_confirm(self, event)
+        return self.execute(context)
+
+    @error_handler
+    def execute(self, context):
+        if self.scope == 'SELECTED':
+            objects = context.selected_objects
+        else:
+            # Objects in excluded collections cannot be selected
+            objects = context.view_layer.objects
+        # Objects without data (empties, rigs' parents) carry no geometry to
+        # duplicate and deleting them would orphan their children
+        objects = [obj for obj in objects if obj.data is not None]
+        if len(objects) < 2:
+            raise Exception("Nothing to compare")
+
+        duplicates, groups = self.find_duplicates(context, objects)
+
+        if self.action == 'SELECT':
+            for obj in context.selected_objects:
+                obj.select_set(False)
+            for obj in duplicates:
+                obj.select_set(True)
+        elif self.action == 'DELETE' and duplicates:
+            bpy.data.batch_remove(ids=duplicates)
+            _symmetry_state["dirty"] = True
+
+        self.report({'INFO'}, f"Found {len(duplicates)} duplicate(s) in {groups} group(s)")
+        return {'FINISHED'}
+
+    def find_duplicates(self, context, objects):
+        precision = context.scene.item_pro_props.transform_precision
+
+        # Quantize every world transform to the precision grid in one pass;
+        # local channels would match children of different parents
+        transforms = _read_matrices(objects)[:, :3, :].reshape(-1, 12)
+        keys = np.empty((len(objects), 13), dtype=np.int64)
+        keys[:, :12] = np.round(np.nan_to_num(transforms) / precision)
+        keys[:, 12] = [(obj.item_pro.full_mesh or obj.data).as_pointer() for obj in objects]
+
+        # View each row as one opaque value so it can be hashed directly
+        rows = keys.view(np.dtype((np.void, keys.itemsize * keys.shape[1]))).ravel()
+
+        # The active object is always kept, otherwise the first one seen
+        active = context.active_object
+        first_seen = {}
+        groups = set()
+        duplicates = []
+        for obj, row in zip(objects, rows.tolist()):
+            kept = first_seen.get(row)
+            if kept is None:
+                first_seen[row] = obj
+                continue
+
+            groups.add(row)
+            if obj == active:
+                duplicates.append(kept)
+                first_seen[row] = obj
+            else:
+                duplicates.append(obj)
+
+        return duplicates, len(groups)
+
+
+# Transform audit
+# All checks run as NumPy masks over transform arrays read in bulk from
+# scene.objects; only the names of flagged objects are kept afterwards.
+AUDIT_CATEGORIES = [
+    ('NON_UNIFORM', "Non-Uniform Scale"),
+    ('NEGATIVE', "Negative Scale"),
+    ('ZERO', "Zero Size"),
+    ('INVALID', "Invalid Coordinates"),
+    ('OFF_GRID', "Off-Grid Rotation"),
+]
+
+GEOMETRY_TYPES = {'MESH', 'CURVE', 'SURFACE', 'FONT', 'META'}
+
+_audit_state = {"counts": {}, "results": {}}
+
+def _run_audit(scene):
+    props = scene.item_pro_props
+    objects = scene.objects
+    location = _read_vectors(objects, "location")
+    rotation = _read_vectors(objects, "rotation_euler")
+    scale = _read_vectors(objects, "scale")
+    dimensions = _read_vectors(objects, "dimensions")
+
+    finite = np.isfinite(np.hstack((location, rotation, scale))).all(axis=1)
+    abs_scale = np.abs(np.nan_to_num(scale))
+    largest = abs_scale.max(axis=1)
+
+    # Rotations more than a thousandth of a degree off the precision grid
+    degrees = np.degrees(np.nan_to_num(rotation))
+    precision = props.transform_precision
+    off_grid = np.abs(degrees - np.round(degrees / precision) * precision) > 1e-3
+
+    zero_scale = (abs_scale < 1e-6).any(axis=1)
+    zero_dimensions = (dimensions < 1e-6).all(axis=1)
+    masks = {
+        'NON_UNIFORM': largest - abs_scale.min(axis=1) > 1e-4 * largest,
+        'NEGATIVE': (scale < 0).any(axis=1),
+        'ZERO': zero_scale | zero_dimensions,
+        'INVALID': ~finite | (np.abs(np.nan_to_num(location)) > props.audit_max_coordinate).any(axis=1),
+        'OFF_GRID': off_grid.any(axis=1),
+    }
+
+    # Names and types are only fetched for flagged objects
+    flagged = np.logical_or.reduce(list(masks.values()))
+    names = {}
+    geometry = np.zeros(len(location), dtype=bool)
+    for i in np.flatnonzero(flagged).tolist():
+        obj = objects[i]
+        names[i] = obj.name
+        geometry[i] = obj.type in GEOMETRY_TYPES
+
+    # Empties and other data-less objects always have zero dimensions
+    masks['ZERO'] = zero_scale | (zero_dimensions & geometry)
+
+    results = {}
+    for category, mask in masks.items():
+        results[category] = [names[i] for i in np.flatnonzero(mask).tolist()]
+
+    _audit_state["results"] = results
+    _audit_state["counts"] = {category: len(found) for category, found in results.items()}
+    return results
+
+def _audit_objects(scene, category):
+    # One pass over the scene instead of a name lookup per object
+    objects = {obj.name: obj for obj in scene.objects}
+    return [objects[name] for name in _audit_state["results"].get(category, []) if name in objects]
+
+class ITEMPRO_OT_AuditTransforms(bpy.types.Operator):
+    bl_idname = "itempro.audit_transforms"
+    bl_label = "Run Audit"
+    bl_description = "Check every object in the scene for problematic transforms"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        results = _run_audit(context.scene)
+        total = len({name for found in results.values() for name in found})
+        self.report({'INFO'}, f"Audit found {total} object(s) with issues")
+        return {'FINISHED'}
+
+class ITEMPRO_OT_AuditSelect(bpy.types.Operator):
+    bl_idname = "itempro.audit_select"
+    bl_label = "Select Audit Results"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    category: bpy.props.EnumProperty(
+        items=[(category, label, label) for category, label in AUDIT_CATEGORIES]
+    )
+
+    def execute(self, context):
+        for obj in context.selected_objects:
+            obj.select_set(False)
+        # Objects in excluded collections cannot be selected
+        selectable = set(context.view_layer.objects)
+        for obj in _audit_objects(context.scene, self.category):
+            if obj in selectable:
+                obj.select_set(True)
+        return {'FINISHED'}
+
+class ITEMPRO_OT_AuditFix(bpy.types.Operator):
+    bl_idname = "itempro.audit_fix"
+    bl_label = "Fix Audit Results"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    category: bpy.props.EnumProperty(
+        items=[(category, label, label) for category, label in AUDIT_CATEGORIES]
+    )
+
+    def execute(self, context):
+        objects = _audit_objects(context.scene, self.category)
+        if not objects:
+            return {'CANCELLED'}
+
+        if self.category in {'NON_UNIFORM', 'NEGATIVE'}:
+            # Bake rotation and scale into the mesh, keep locations
+            _apply_transforms([obj for obj in objects if obj.type == 'MESH'], apply_location=False)
+        elif self.category == 'ZERO':
+            scale = _read_vectors(objects, "scale")
+            scale[np.abs(scale) < 1e-6] = 1.0
+            _write_vectors(objects, "scale", scale)
+        elif self.category == 'INVALID':
+            # Non-finite values are reset, out-of-range locations clamped
+            limit = context.scene.item_pro_props.audit_max_coordinate
+            location = _read_vectors(objects, "location")
+            location[~np.isfinite(location)] = 0.0
+            location = np.clip(location, -limit, limit)
+            rotation = _read_vectors(objects, "rotation_euler")
+            rotation[~np.isfinite(rotation)] = 0.0
+            scale = _read_vectors(objects, "scale")
+            scale[~np.isfinite(scale)] = 1.0
+            _write_vectors(objects, "location", location)
+            _write_vectors(objects, "rotation_euler", rotation)
+            _write_vectors(objects, "scale", scale)
+        elif self.category == 'OFF_GRID':
+            precision = context.scene.item_pro_props.transform_precision
+            degrees = np.degrees(_read_vectors(objects, "rotation_euler"))
+            _write_vectors(objects, "rotation_euler", np.radians(np.round(degrees / precision) * precision))
+
+        _run_audit(context.scene)
+        return {'FINISHED'}
+
+class ITEMPRO_OT_ExportAudit(bpy.types.Operator, ExportHelper):
+    bl_idname = "itempro.export_audit"
+    bl_label = "Export Report"
+    bl_description = "Write the last audit results to a CSV file"
+    bl_options = {'REGISTER'}
+
+    filename_ext = ".csv"
+
+    filter_glob: bpy.props.StringProperty(
+        default="*.csv",
+        options={'HIDDEN'}
+    )
+
+    def execute(self, context):
+        results = _audit_state["results"]
+        if not results:
+            results = _run_audit(context.scene)
+
+        with open(self.filepath, 'w', newline='') as file:
+            writer = csv.writer(file)
+            writer.writerow(["object", "issue", "location", "rotation", "scale"])
+            for category, label in AUDIT_CATEGORIES:
+                for obj in _audit_objects(context.scene, category):
+                    writer.writerow([
+                        obj.name,
+                        label,
+                        " ".join(f"{value:g}" for value in obj.location),
+                        " ".join(f"{value:g}" for value in obj.rotation_euler),
+                        " ".join(f"{value:g}" for value in obj.scale),
+                    ])
+
+        self.report({'INFO'}, f"Report written to {self.filepath}")
+        return {'FINISHED'}
+
+
+# Proximity
+# One KD-tree of the view layer's object positions is kept between queries.
+# Objects in excluded collections are left out since they cannot be
+# selected. The tree is marked dirty by the depsgraph handler when any
+# object moves and rebuilt on demand.
+_kdtree_state = {"tree": None, "objects": [], "key": None, "dirty": True}
+
+def _get_kdtree(view_layer, use_bounds):
+    state = _kdtree_state
+    key = (view_layer.as_pointer(), use_bounds, len(view_layer.objects))
+    if state["dirty"] or state["key"] != key:
+        objects = view_layer.objects
+        if use_bounds:
+            points = _read_bounds_centers(objects)
+        else:
+            points = _read_matrices(objects)[:, :3, 3]
+
+        tree = kdtree.KDTree(len(points))
+        for i, co in enumerate(points.tolist()):
+            tree.insert(co, i)
+        tree.balance()
+        state.update(tree=tree, objects=list(objects), key=key, dirty=False)
+    return state["tree"], state["objects"]
+
+def _proximity_point(obj, use_bounds):
+    if use_bounds:
+        center = sum((Vector(corner) for corner in obj.bound_box), Vector()) / 8
+        return obj.matrix_world @ center
+    return obj.matrix_world.translation
+
+class ITEMPRO_OT_SelectWithinRadius(bpy.types.Operator):
+    bl_idname = "itempro.select_within_radius"
+    bl_label = "Select Within Radius"
+    bl_description = "Select every object within the search radius of the active object"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        active = context.active_object
+        if not active:
+            self.report({'ERROR'}, "No active object")
+            return {'CANCELLED'}
+
+        props = context.scene.item_pro_props
+        tree, objects = _get_kdtree(context.view_layer, props.proximity_use_bounds)
+        point = _proximity_point(active, props.proximity_use_bounds)
+
+        found = tree.find_range(point, props.proximity_radius)
+        for _, index, _ in found:
+            objects[index].select_set(True)
+
+        self.report({'INFO'}, f"Selected {len(found)} object(s)")
+        return {'FINISHED'}
+
+class ITEMPRO_OT_SnapToNearest(bpy.types.Operator):
+    bl_idname = "itempro.snap_to_nearest"
+    bl_label = "Snap to Nearest"
+    bl_description = "Move each selected object to its nearest neighbour, kept apart by the snap offset"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        selected = context.selected_objects
+        if not selected:
+            self.report({'ERROR'}, "No objects selected")
+            return {'CANCELLED'}
+
+        props = context.scene.item_pro_props
+        tree, objects = _get_kdtree(context.view_layer, props.proximity_use_bounds)
+
+        # Only unselected objects are targets, so selected objects never snap
+        # onto each other's old positions or swap places
+        selected_set = set(selected)
+        excluded = {i for i, obj in enumerate(objects) if obj in selected_set}
+        moves = []
+        for obj in selected:
+            point = _proximity_point(obj, props.proximity_use_bounds)
+            co, index, _ = tree.find(point, filter=lambda i: i not in excluded)
+            if index is None:
+                continue
+            direction = (point - co).normalized()
+            moves.append((obj, co + direction * props.snap_offset - point))
+
+        if not moves:
+            self.report({'WARNING'}, "No unselected objects to snap to")
+            return {'CANCELLED'}
+
+        for obj, delta in moves:
+            matrix = obj.matrix_world.copy()
+            matrix.translation += delta
+            obj.matrix_world = matrix
+
+        return {'FINISHED'}
+
+class ITEMPRO_OT_MeasureSpacing(bpy.types.Operator):
+    bl_idname = "itempro.measure_spacing"
+    bl_label = "Measure Spacing"
+    bl_description = "Report nearest neighbour distances between the selected objects"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        selected = context.selected_objects
+        if len(selected) < 2:
+            self.report({'ERROR'}, "Select at least two objects")
+            return {'CANCELLED'}
+
+        props = context.scene.item_pro_props
+        tree, objects = _get_kdtree(context.view_layer, props.proximity_use_bounds)
+        selected_indices = {
+            index for index, obj in enumerate(objects) if obj.select_get()
+        }
+
+        distances = []
+        for index in selected_indices:
+            point = _proximity_point(objects[index], props.proximity_use_bounds)
+            _, _, distance = tree.find(
+                point,
+                filter=lambda other: other != index and other in selected_indices
+            )
+            distances.append(distance)
+
+        distances = np.array(distances)
+        self.report(
+            {'INFO'},
+            f"Spacing min {distances.min():.4f}, mean {distances.mean():.4f}, "
+            f"max {distances.max():.4f}, std {distances.std():.4f}"
+        )
+        return {'FINISHED'}
+
+
+# Viewport budget
+# Generated objects beyond the budget switch to bounds display or to a proxy
+# mesh shared per source mesh. The budget is only evaluated again once the
+# reference has moved further than the update threshold.
+_budget_state = {"objects": [], "key": None, "dirty": True, "origin": None, "suspended": False}
+
+PROXY_SUFFIX = ".itempro_proxy"
+
+def _mark_generated(obj, source_mesh=None):
+    item = obj.item_pro
+    item.budget_managed = True
+    if isinstance(source_mesh, bpy.types.Mesh):
+        item.source_mesh = source_mesh
+    _budget_state["dirty"] = True
+
+def _get_budget_objects(scene):
+    state = _budget_state
+    key = (scene.as_pointer(), len(scene.objects))
+    if state["dirty"] or state["key"] != key:
+        objects = [obj for obj in scene.objects if obj.item_pro.budget_managed]
+        state.update(objects=objects, key=key, dirty=False)
+    return state["objects"]
+
+def _get_proxy_mesh(mesh):
+    # Convex hull of the source vertices, built once per source mesh and
+    # kept on the mesh itself so renames and long names still find it
+    proxy = mesh.item_pro_proxy
+    if proxy is not None:
+        return proxy
+
+    co = np.empty(len(mesh.vertices) * 3, dtype=np.float32)
+    mesh.vertices.foreach_get("co", co)
+    bm = bmesh.new()
+    for vert in co.reshape(-1, 3).tolist():
+        bm.verts.new(vert)
+    if len(bm.verts) >= 4:
+        hull = bmesh.ops.convex_hull(bm, input=bm.verts)
+        bmesh.ops.delete(bm, geom=hull["geom_interior"] + hull["geom_unused"], context='VERTS')
+
+    proxy = bpy.data.meshes.new(mesh.name + PROXY_SUFFIX)
+    bm.to_mesh(proxy)
+    bm.free()
+    if mesh.materials:
+        proxy.materials.append(mesh.materials[0])
+    mesh.item_pro_proxy = proxy
+    return proxy
+
+def _restore_full_detail(objects):
+    # Mesh edits must reach the full mesh, never the shared proxy
+    for obj in objects:
+        if obj.item_pro.budget_reduced:
+            _set_reduced(obj, False, 'PROXY')
+
+def _geometry_edited(mesh, objects):
+    # The proxy and the source mesh no longer describe the edited geometry
+    mesh.item_pro_proxy = None
+    for obj in objects:
+        obj.item_pro.source_mesh = None
+
+def _set_reduced(obj, reduced, mode):
+    item = obj.item_pro
+    use_proxy = reduced and mode == 'PROXY' and obj.type == 'MESH'
+    if item.budget_reduced == reduced and (item.full_mesh is not None) == use_proxy:
+        return
+
+    # Restore full detail first, then apply the requested reduction
+    if item.budget_reduced:
+        if item.full_mesh is not None:
+            obj.data = item.full_mesh
+            item.full_mesh = None
+        obj.display_type = item.full_display_type
+        item.budget_reduced = False
+
+    if reduced:
+        item.full_display_type = obj.display_type
+        if use_proxy:
+            item.full_mesh = obj.data
+            obj.data = _get_proxy_mesh(item.source_mesh or obj.data)
+        else:
+            obj.display_type = 'BOUNDS'
+        item.budget_reduced = True
+
+def _evaluate_budget(scene, force=False):
+    # Renders and saves run with full detail, see _on_render_or_save_pre
+    if _budget_state["suspended"]:
+        return
+    try:
+        _apply_budget(scene, force)
+    except ReferenceError:
+        # A cached object was removed while the object count stayed the same
+        _budget_state["dirty"] = True
+        _apply_budget(scene, True)
+
+def _apply_budget(scene, force):
+    props = scene.item_pro_props
+    objects = _get_budget_objects(scene)
+    if not props.budget_enabled:
+        for obj in objects:
+            _set_reduced(obj, False, props.budget_mode)
+        _budget_state["origin"] = None
+        return
+    if not objects:
+        return
+
+    reference = props.budget_reference or scene.camera
+    origin = reference.matrix_world.translation.copy() if reference else Vector()
+    last = _budget_state["origin"]
+    if not force and last is not None and (origin - last).length < props.budget_threshold:
+        return
+    _budget_state["origin"] = origin
+
+    # Keep the closest objects within the distance at full detail
+    distances = np.linalg.norm(_read_locations(objects, True) - np.array(origin), axis=1)
+    full = np.zeros(len(objects), dtype=bool)
+    full[np.argsort(distances, kind='stable')[:props.budget_max_count]] = True
+    if props.budget_distance > 0:
+        full &= distances <= props.budget_distance
+
+    for obj, keep in zip(objects, full.tolist()):
+        _set_reduced(obj, not keep, props.budget_mode)
+
+class ITEMPRO_OT_UpdateBudget(bpy.types.Operator):
+    bl_idname = "itempro.update_budget"
+    bl_label = "Update Budget"
+    bl_description = "Evaluate the viewport budget now"
+    bl_options = {'REGISTER'}
+
+    def execute(self, context):
+        _budget_state["dirty"] = True
+        _evaluate_budget(context.scene, force=True)
+        return {'FINISHED'}
+
+class ITEMPRO_OT_RestoreFullDetail(bpy.types.Operator):
+    bl_idname = "itempro.restore_full_detail"
+    bl_label = "Restore Full Detail"
+    bl_description = "Disable the viewport budget and restore every generated object"
+    bl_options = {'REGISTER', 'UNDO'}
+
+    def execute(self, context):
+        # The property update restores the objects
+        context.scene.item_pro_props.budget_enabled = False
+        return {'FINISHED'}
+
+
+# Live sync
+# Maps source object pointer -> indices into scene.item_pro_props.symmetry_links.
+# Only link indices are cached (never bpy objects) so the index survives undo;
+# it is rebuilt lazily whenever links change or a file/undo step is loaded.
+_symmetry_state = {"scene": None, "dirty": True, "index": {}}
+
+def _get_symmetry_index(scene):
+    if _symmetry_state["dirty"] or _symmetry_state["scene"] != scene.as_pointer():
+        index = {}
+        for i, link in enumerate(scene.item_pro_props.symmetry_links):
+            if link.source and link.mirror:
+                index.setdefault(link.source.as_pointer(), []).append(i)
+        _symmetry_state.update(scene=scene.as_pointer(), dirty=False, index=index)
+    return _symmetry_state["index"]
+
+def _sync_symmetry(scene, changed):
+    links = scene.item_pro_props.symmetry_links
+    if not links:
+        return
+
+    index = _get_symmetry_index(scene)
+    for pointer in changed:
+        for i in index.get(pointer, ()):
+            link = links[i]
+            if link.source and link.mirror:
+                _mirror_transform(link.source, link.mirror, link.axis)
+
+def _capture_constraint_base(obj, unit_dimensions=None):
+    item = obj.item_pro
+    if unit_dimensions is None:
+        unit_dimensions = [
+            dim / abs(scale) if scale != 0 else 0.0
+            for dim, scale in zip(obj.dimensions, obj.scale)
+        ]
+    item.unit_dimensions = unit_dimensions
+    item.base_dimensions = [unit_dimensions[i] * abs(obj.scale[i]) for i in range(3)]
+    item.last_scale = obj.scale
+
+def _constrain_dimensions(obj, lock, proportional):
+    item = obj.item_pro
+    last = item.last_scale[:]
+    scale = list(obj.scale)
+    if scale == list(last):
+        return
+
+    if proportional:
+        # Follow the unlocked axis that changed the most
+        ratios = [scale[i] / last[i] if last[i] != 0 else 1.0 for i in range(3)]
+        moved = [i for i in range(3) if not lock[i] and abs(ratios[i] - 1.0) > 1e-6]
+        if moved:
+            factor = ratios[max(moved, key=lambda i: abs(ratios[i] - 1.0))]
+            scale = [last[i] * factor for i in range(3)]
+
+    for i in range(3):
+        if lock[i] and item.unit_dimensions[i] != 0:
+            scale[i] = math.copysign(item.base_dimensions[i] / item.unit_dimensions[i], scale[i])
+
+    if scale != list(obj.scale):
+        obj.scale = scale
+    item.last_scale = scale
+
+def _sync_dimension_constraints(scene, changed, reshaped):
+    props = scene.item_pro_props
+
+    # Geometry edits change the unit dimensions, refresh the cache for those only
+    for obj in reshaped.values():
+        if obj.item_pro.live_constraints and obj.type != 'EMPTY':
+            scale = obj.scale
+            obj.item_pro.unit_dimensions = [
+                dim / abs(scale[i]) if scale[i] != 0 else 0.0
+                for i, dim in enumerate(obj.dimensions)
+            ]
+
+    lock = props.lock_dimensions[:]
+    proportional = props.constrain_proportional
+    if not proportional and not any(lock):
+        return
+
+    for obj in changed.values():
+        if obj.item_pro.live_constraints:
+            _constrain_dimensions(obj, lock, proportional)
+
+@persistent
+def _on_depsgraph_update(scene, depsgraph):
+    # Collect originals of objects whose transform or geometry changed in
+    # this update, so every sync below only touches what actually moved
+    changed = {}
+    reshaped = {}
+    for update in depsgraph.updates:
+        if not isinstance(update.id, bpy.types.Object):
+            continue
+        obj = update.id.original
+        if update.is_updated_transform:
+            changed[obj.as_pointer()] = obj
+        if update.is_updated_geometry:
+            reshaped[obj.as_pointer()] = obj
+
+    if changed:
+        _sync_symmetry(scene, changed)
+    if changed or reshaped:
+        _sync_dimension_constraints(scene, changed, reshaped)
+
+    # Geometry edits only move bounding box centers, not origins
+    use_bounds = _kdtree_state["key"] is not None and _kdtree_state["key"][1]
+    if changed or (reshaped and use_bounds):
+        _kdtree_state["dirty"] = True
+
+    terrain_key = _terrain_state["key"]
+    if terrain_key is not None and (terrain_key[0] in changed or terrain_key[0] in reshaped):
+        _terrain_state["key"] = None
+
+    props = scene.item_pro_props
+    if changed and props.budget_enabled:
+        reference = props.budget_reference or scene.camera
+        if reference is not None and reference.as_pointer() in changed:
+            _evaluate_budget(scene)
+
+@persistent
+def _on_load_or_undo(*args):
+    _symmetry_state["dirty"] = True
+    _kdtree_state["dirty"] = True
+    _budget_state["dirty"] = True
+    _budget_state["origin"] = None
+    _terrain_state["key"] = None
+    # Results name objects of the file they were found in
+    _audit_state["counts"] = {}
+    _audit_state["results"] = {}
+
+# Proxies swap the mesh datablock, so renders and saved files would get them
+# too. They are restored before and re-applied after, keeping the budget
+# viewport-only. Render jobs are wrapped once, not per animation frame.
+@persistent
+def _on_render_or_save_pre(*args):
+    _budget_state["suspended"] = True
+    for scene in bpy.data.scenes:
+        _restore_full_detail([obj for obj in scene.objects if obj.item_pro.budget_reduced])
+
+@persistent
+def _on_render_or_save_post(*args):
+    _budget_state["suspended"] = False
+    _budget_state["dirty"] = True
+    for scene in bpy.data.scenes:
+        if scene.item_pro_props.budget_enabled:
+            _evaluate_budget(scene, force=True)
+
+_handlers = [
+    (bpy.app.handlers.depsgraph_update_post, _on_depsgraph_update),
+    (bpy.app.handlers.load_post, _on_load_or_undo),
+    (bpy.app.handlers.undo_post, _on_load_or_undo),
+    (bpy.app.handlers.redo_post, _on_load_or_undo),
+    (bpy.app.handlers.render_init, _on_render_or_save_pre),
+    (bpy.app.handlers.render_complete, _on_render_or_save_post),
+    (bpy.app.handlers.render_cancel, _on_render_or_save_post),
+    (bpy.app.handlers.save_pre, _on_render_or_save_pre),
+    (bpy.app.handlers.save_post, _on_render_or_save_post),
+]
 
 # Registration
 classes = [
+    ITEMPRO_SymmetryLink,
+    ITEMPRO_ObjectProperties,
     ITEMPRO_Properties,
     ITEMPRO_PT_MainPanel,
     ITEMPRO_OT_ResetTransformations,
@@ -912,18 +2822,33 @@ classes = [
     ITEMPRO_OT_AlignObjects,
     ITEMPRO_OT_StackObjects,
     ITEMPRO_OT_DistributeObjects,
+    ITEMPRO_OT_ImportPlacements,
     ITEMPRO_OT_ApplyUniformScale,
     ITEMPRO_OT_ResetScale,
+    ITEMPRO_OT_ApplyTransforms,
     ITEMPRO_OT_SmoothRotate,
     ITEMPRO_OT_RandomRotate,
+    ITEMPRO_OT_BakeAnimation,
     ITEMPRO_OT_CreateArray,
     ITEMPRO_OT_CreateSymmetry,
+    ITEMPRO_OT_UnlinkSymmetry,
     ITEMPRO_OT_MirrorObject,
     ITEMPRO_OT_ApplyDimensions,
+    ITEMPRO_OT_SetLiveConstraints,
     ITEMPRO_OT_ResetDimensions,
     ITEMPRO_OT_PlaceOnGround,
     ITEMPRO_OT_SetPivot,
     ITEMPRO_OT_PrecisionTransform,
+    ITEMPRO_OT_FindDuplicates,
+    ITEMPRO_OT_AuditTransforms,
+    ITEMPRO_OT_AuditSelect,
+    ITEMPRO_OT_AuditFix,
+    ITEMPRO_OT_ExportAudit,
+    ITEMPRO_OT_SelectWithinRadius,
+    ITEMPRO_OT_SnapToNearest,
+    ITEMPRO_OT_MeasureSpacing,
+    ITEMPRO_OT_UpdateBudget,
+    ITEMPRO_OT_RestoreFullDetail,
 ]
 
 
@@ -943,13 +2868,39 @@ def register():
             
     # Register properties
     bpy.types.Scene.item_pro_props = bpy.props.PointerProperty(type=ITEMPRO_Properties)
+    bpy.types.Object.item_pro = bpy.props.PointerProperty(type=ITEMPRO_ObjectProperties)
+    bpy.types.Mesh.item_pro_proxy = bpy.props.PointerProperty(type=bpy.types.Mesh)
+
+    # Register handlers
+    for handler_list, handler in _handlers:
+        if handler not in handler_list:
+            handler_list.append(handler)
+
+    # Expose the scripting API as `import itempro`
+    sys.modules["itempro"] = sys.modules[__name__]
 
 def unregister():
+    if sys.modules.get("itempro") is sys.modules.get(__name__):
+        del sys.modules["itempro"]
+
+    # Remove handlers
+    for handler_list, handler in _handlers:
+        if handler in handler_list:
+            handler_list.remove(handler)
+
     # Remove properties
     try:
         del bpy.types.Scene.item_pro_props
     except:
         pass
+    try:
+        del bpy.types.Object.item_pro
+    except:
+        pass
+    try:
+        del bpy.types.Mesh.item_pro_proxy
+    except:
+        pass
 
     # Unregister classes in reverse order
     for cls in reversed(classes):